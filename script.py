@@ -1,8 +1,11 @@
+import itertools
+import math
 import random
 import time
-import uuid
-from typing import List, Dict, Optional, Tuple
+from collections import deque
+from typing import Deque, List, Dict, Optional, Tuple
 
+import numpy as np
 from faker import Faker
 from rich.console import Console
 from rich.table import Table
@@ -17,8 +20,11 @@ class NetworkConfig:
     This makes the simulation easily tunable and parameters are centralized.
     """
     SLOTS_PER_EPOCH: int = 32
+    SECONDS_PER_SLOT: int = 12
+    CHAIN_RETENTION_SLOTS: int = 2 * SLOTS_PER_EPOCH  # Only the most recent blocks are kept in memory
+    GWEI_PER_ETH: int = 10**9  # Balances are tracked as integer gwei, as in Eth2
     MIN_STAKE_AMOUNT: float = 32.0
-    BASE_REWARD_PER_EPOCH: float = 0.0001  # A base reward factor
+    BASE_REWARD_FACTOR: int = 64  # Eth2 base reward factor; rewards scale with 1/sqrt(total active stake)
     INACTIVITY_PENALTY_FACTOR: float = 0.5  # Penalty is a fraction of the base reward
     SLASHING_PENALTY_PERCENTAGE: float = 0.05  # 5% of stake is slashed for severe offenses
     PROPOSER_BONUS_FACTOR: float = 0.1 # Proposer gets a small bonus (10% of the reward)
@@ -27,91 +33,125 @@ class NetworkConfig:
     VALIDATOR_ONLINE_PROBABILITY: float = 0.98 # Chance a validator is online to attest
     SLASHABLE_OFFENSE_PROBABILITY: float = 0.001 # Very low chance of a slashable offense
 
+    # Output parameters
+    VERBOSE: bool = False # Log every slot's events as they happen (slows down large simulations)
+    INTERACTIVE: bool = True # Pause between epochs for readability when printing to a terminal
+
+def build_alias_table(weights: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Builds Walker's alias tables (`prob`, `alias`) for sampling indices in proportion to `weights`.
+    Each column i keeps itself with probability prob[i] and otherwise yields alias[i].
+
+    Columns below the mean weight ("light") are filled from columns above it ("heavy") in a
+    single sweep: laying the light deficits and heavy surpluses end to end, each light column
+    is aliased to the heavy column whose surplus it starts in. A heavy column that is drained
+    below the mean becomes light and is topped up by the next heavy column. Both are computed
+    with prefix sums, so the whole build is vectorized.
+    """
+    n = len(weights)
+    scaled = weights * (n / weights.sum())
+    prob = np.ones(n)
+    alias = np.arange(n)
+
+    light = np.flatnonzero(scaled < 1.0)
+    heavy = np.flatnonzero(scaled >= 1.0)
+    if not len(light) or not len(heavy):
+        return prob, alias
+
+    deficit_end = np.cumsum(1.0 - scaled[light])
+    deficit_start = deficit_end - (1.0 - scaled[light])
+    surplus_end = np.cumsum(scaled[heavy] - 1.0)
+
+    prob[light] = scaled[light]
+    # Clip guards against rounding pushing the last light column past the final surplus
+    alias[light] = heavy[np.minimum(np.searchsorted(surplus_end, deficit_start, side="right"), len(heavy) - 1)]
+
+    # A heavy column is drained past the mean when the last light column starting inside its
+    # surplus ends beyond it; the overshoot is taken from the next heavy column instead.
+    last_light = np.searchsorted(deficit_start, surplus_end[:-1], side="left") - 1
+    overshoot = np.where(last_light >= 0, deficit_end[last_light] - surplus_end[:-1], 0.0)
+    drained = overshoot > 0.0
+    prob[heavy[:-1][drained]] = 1.0 - overshoot[drained]
+    alias[heavy[:-1][drained]] = heavy[1:][drained]
+    return prob, alias
+
+def alias_choice(prob: np.ndarray, alias: np.ndarray, rng: np.random.Generator, size: int) -> np.ndarray:
+    """Draws `size` indices from alias tables built by `build_alias_table`, in O(1) per draw."""
+    columns = rng.integers(len(prob), size=size)
+    return np.where(rng.random(size) < prob[columns], columns, alias[columns])
+
 class Block:
     """
     Represents a single block in the blockchain.
     In this simulation, it's a simplified data structure to track proposals and attestations.
+    Attestations are a bitset with one flag per validator, indexed by the validator's dense index.
     """
-    def __init__(self, slot_number: int, proposer_id: str):
+    __slots__ = ("slot_number", "proposer_id", "attestations", "timestamp")
+
+    def __init__(self, slot_number: int, proposer_id: int, num_validators: int, timestamp: float):
         self.slot_number = slot_number
         self.proposer_id = proposer_id
-        self.attestations: List[str] = []
-        self.timestamp = time.time()
+        self.attestations: np.ndarray = np.zeros(num_validators, dtype=bool)
+        self.timestamp = timestamp
 
-    def add_attestation(self, validator_id: str):
+    @property
+    def attestation_count(self) -> int:
+        """Number of validators that attested to the block."""
+        return int(np.count_nonzero(self.attestations))
+
+    def add_attestation(self, validator_index: int):
         """Adds a validator's attestation to the block."""
-        if validator_id not in self.attestations:
-            self.attestations.append(validator_id)
+        self.attestations[validator_index] = True
 
 class Validator:
     """
     Represents a single validator node in the Proof-of-Stake network.
-    Manages its own state, including stake, rewards, and performance metrics.
+    Carries the validator's identity; once registered, its numeric state
+    (stake, rewards, and performance metrics) lives in the network's state columns.
     """
+    _ids = itertools.count()  # Monotonic source of unique validator IDs
+
     def __init__(self, initial_stake: float):
         if initial_stake < NetworkConfig.MIN_STAKE_AMOUNT:
             raise ValueError(f"Initial stake must be at least {NetworkConfig.MIN_STAKE_AMOUNT}")
 
-        self.id: str = str(uuid.uuid4())
-        self.name: str = f"validator-{faker.word()}-{self.id[:4]}"
-        self.staked_amount: float = initial_stake
-        self.rewards_earned: float = 0.0
-        self.is_active: bool = True
+        self.id: int = next(Validator._ids)
+        self.name: str = f"validator-{faker.word()}-{self.id:04d}"
+        self.initial_stake: float = initial_stake
 
-        # Performance tracking for an epoch
-        self.slots_attested: int = 0
-        self.slots_missed: int = 0
-        self.proposed_blocks: int = 0
+        # Owning network and dense position in its state columns, assigned on registration
+        self.network: Optional["PoSNetwork"] = None
+        self.index: int = -1
 
     def __repr__(self) -> str:
         return f"Validator(id={self.id}, stake={self.staked_amount:.4f}, active={self.is_active})"
 
-    def propose_block(self, slot_number: int) -> Block:
-        """Action: Propose a new block for a given slot."""
-        console.log(f"[bold cyan]Validator {self.name}[/] is proposing a block for slot {slot_number}.")
-        self.proposed_blocks += 1
-        return Block(slot_number, self.id)
-
-    def attest_to_block(self) -> bool:
-        """
-        Action: Attest to a block. Simulates network latency or node downtime.
-        Returns True if the validator successfully attests, False otherwise.
-        """
-        if random.random() < NetworkConfig.VALIDATOR_ONLINE_PROBABILITY:
-            self.slots_attested += 1
+    @property
+    def staked_amount(self) -> float:
+        """The validator's current stake."""
+        if self.network is None:
+            return self.initial_stake
+        return int(self.network.stake[self.index]) / NetworkConfig.GWEI_PER_ETH
+
+    @property
+    def rewards_earned(self) -> float:
+        """Net rewards earned since registration."""
+        if self.network is None:
+            return 0.0
+        return int(self.network.rewards[self.index]) / NetworkConfig.GWEI_PER_ETH
+
+    @property
+    def is_active(self) -> bool:
+        """Whether the validator is still part of the active set."""
+        if self.network is None:
             return True
-        else:
-            self.slots_missed += 1
-            return False
-
-    def process_epoch_rewards(self, reward: float, is_proposer_bonus: bool = False):
-        """Updates the validator's balance with earned rewards."""
-        self.staked_amount += reward
-        self.rewards_earned += reward
-        bonus_text = "(Proposer Bonus)" if is_proposer_bonus else ""
-        #console.log(f"Validator {self.name} received reward of {reward:.6f} ETH. {bonus_text}")
-
-    def process_inactivity_penalty(self, penalty: float):
-        """Applies a penalty for being offline (missing attestations)."""
-        self.staked_amount -= penalty
-        self.rewards_earned -= penalty
-        #console.log(f"[yellow]Validator {self.name} penalized by {penalty:.6f} ETH for inactivity.[/yellow]")
-
-    def process_slashing(self):
-        """
-        Applies a severe penalty for a major protocol violation.
-        The validator is forcefully exited from the active set.
-        """
-        slashed_amount = self.staked_amount * NetworkConfig.SLASHING_PENALTY_PERCENTAGE
-        self.staked_amount -= slashed_amount
-        self.is_active = False
-        console.log(f"[bold red]CRITICAL: Validator {self.name} SLASHED! Lost {slashed_amount:.4f} ETH and ejected from the network.[/bold red]")
+        return bool(self.network.active[self.index])
 
-    def reset_epoch_metrics(self):
-        """Resets performance counters at the start of a new epoch."""
-        self.slots_attested = 0
-        self.slots_missed = 0
-        self.proposed_blocks = 0
+    def propose_block(self, slot_number: int, num_validators: int, timestamp: float) -> Block:
+        """Action: Propose a new block for a given slot."""
+        if NetworkConfig.VERBOSE:
+            console.log(f"[bold cyan]Validator {self.name}[/] is proposing a block for slot {slot_number}.")
+        return Block(slot_number, self.id, num_validators, timestamp)
 
 
 class PoSNetwork:
@@ -120,40 +160,165 @@ class PoSNetwork:
     Manages the set of validators, the blockchain state (slots, epochs),
     and the application of consensus rules, rewards, and penalties.
     """
-    def __init__(self):
-        self.validators: Dict[str, Validator] = {}
+    # Per-validator state columns and their dtypes
+    _STATE_COLUMNS: Tuple[Tuple[str, type], ...] = (
+        ("stake", np.int64),
+        ("rewards", np.int64),
+        ("attested", np.int64),
+        ("missed", np.int64),
+        ("proposed", np.int64),
+        ("active", bool),
+    )
+
+    def __init__(self, seed: Optional[int] = None):
+        self.validators: Dict[int, Validator] = {}
         self.current_slot: int = 0
         self.current_epoch: int = 0
-        self.chain: List[Block] = []
+        self.chain: Deque[Block] = deque(maxlen=NetworkConfig.CHAIN_RETENTION_SLOTS)
+        self.genesis_time: float = time.time()  # Block timestamps are derived from it and the slot number
+
+        # Dedicated random generator for all simulation draws; pass a seed for reproducible runs
+        self._rng: np.random.Generator = np.random.default_rng(seed)
+
+        # Validator state stored as columns (structure-of-arrays), indexed by each
+        # validator's dense index, so epoch processing runs as vectorized operations.
+        # Balances are integer gwei, which keeps the reward arithmetic exact across epochs.
+        self.stake: np.ndarray = np.zeros(0, dtype=np.int64)
+        self.rewards: np.ndarray = np.zeros(0, dtype=np.int64)
+        self.attested: np.ndarray = np.zeros(0, dtype=np.int64)
+        self.missed: np.ndarray = np.zeros(0, dtype=np.int64)
+        self.proposed: np.ndarray = np.zeros(0, dtype=np.int64)
+        self.active: np.ndarray = np.zeros(0, dtype=bool)
+
+        # Backing buffers of the state columns (and of `active_indices`). Their capacity
+        # doubles as validators register, so registration is amortized O(1); the public
+        # arrays are views of the used prefix and in-place updates write straight through.
+        self._capacity: int = 0
+        self._buffers: Dict[str, np.ndarray] = {name: getattr(self, name) for name, _ in self._STATE_COLUMNS}
+        self._active_indices_buffer: np.ndarray = np.zeros(0, dtype=np.int64)
+
+        # Validators partitioned by status. `active_indices` holds the dense indices of
+        # `active_validators` in the same (ascending) order and is updated on slashing.
+        self.active_validators: List[Validator] = []
+        self.inactive_validators: List[Validator] = []
+        self.active_indices: np.ndarray = np.zeros(0, dtype=np.int64)
+
+        # Running total of the active stake in gwei, updated in place on every stake change
+        self._total_active_stake: int = 0
+
+        # Cached alias tables for proposer selection, rebuilt lazily whenever stakes change
+        self._alias_prob: np.ndarray = np.zeros(0)
+        self._alias: np.ndarray = np.zeros(0, dtype=np.int64)
+        self._alias_dirty: bool = True
+
+        # Slashing events of the current epoch as (slot, validator, slashed amount), reported
+        # together in one table at the end of the epoch (unless already logged in verbose mode)
+        self._slashing_events: List[Tuple[int, Validator, int]] = []
 
     def add_validator(self, validator: Validator):
         """Registers a new validator into the network's pool."""
         if validator.id in self.validators:
             console.log(f"[bold red]Error:[/] Validator with ID {validator.id} already exists.")
             return
+        index = len(self.validators)
+        if index == self._capacity:
+            self._grow_buffers()
+
+        validator.network = self
+        validator.index = index
         self.validators[validator.id] = validator
-        console.log(f"Validator {validator.name} with {validator.staked_amount:.2f} ETH joined the network.")
 
-    def _get_active_validators(self) -> List[Validator]:
-        """Returns a list of all validators that are currently active."""
-        return [v for v in self.validators.values() if v.is_active]
+        # Unused buffer entries are zero, so only the non-zero fields need writing
+        self._buffers["stake"][index] = round(validator.initial_stake * NetworkConfig.GWEI_PER_ETH)
+        self._buffers["active"][index] = True
+        self._active_indices_buffer[len(self.active_validators)] = index
+        self.active_validators.append(validator)
+        self._update_views()
+        self._total_active_stake += int(self.stake[validator.index])
+        self._alias_dirty = True
+        console.log(f"Validator {validator.name} with {validator.staked_amount:.2f} ETH joined the network.")
 
-    def _select_block_proposer(self) -> Optional[Validator]:
+    def _grow_buffers(self):
+        """Doubles the capacity of the state column buffers, copying the registered entries."""
+        count = len(self.validators)
+        self._capacity = max(2 * self._capacity, 16)
+        for name, dtype in self._STATE_COLUMNS:
+            buffer = np.zeros(self._capacity, dtype=dtype)
+            buffer[:count] = self._buffers[name][:count]
+            self._buffers[name] = buffer
+        buffer = np.zeros(self._capacity, dtype=np.int64)
+        buffer[:len(self.active_validators)] = self.active_indices
+        self._active_indices_buffer = buffer
+
+    def _update_views(self):
+        """Points the public state columns and `active_indices` at the used prefix of their buffers."""
+        count = len(self.validators)
+        for name, _ in self._STATE_COLUMNS:
+            setattr(self, name, self._buffers[name][:count])
+        self.active_indices = self._active_indices_buffer[:len(self.active_validators)]
+
+    def _select_block_proposers(self, num_slots: int) -> List[Validator]:
         """
-        Selects a block proposer for the current slot.
+        Selects block proposers for the next `num_slots` slots in a single batch.
         The selection is weighted by the validator's staked amount. Higher stake means
         a higher chance of being selected, which is a core tenet of PoS.
+        Stakes only change at epoch boundaries or on slashing, so every slot in the
+        batch shares the same weight distribution.
+        Returns an empty list if there are no active validators.
         """
-        active_validators = self._get_active_validators()
-        if not active_validators:
-            return None
+        if not self.active_validators:
+            return []
 
-        total_stake = sum(v.staked_amount for v in active_validators)
-        weights = [v.staked_amount / total_stake for v in active_validators]
+        if self._alias_dirty:
+            self._alias_prob, self._alias = build_alias_table(self.stake[self.active_indices])
+            self._alias_dirty = False
 
-        # Weighted random selection
-        proposer = random.choices(active_validators, weights=weights, k=1)[0]
-        return proposer
+        # Weighted random selection with the alias method, O(1) per draw
+        indices = alias_choice(self._alias_prob, self._alias, self._rng, num_slots)
+        return [self.active_validators[i] for i in indices.tolist()]
+
+    def process_slashing(self, validator: Validator):
+        """
+        Applies a severe penalty for a major protocol violation.
+        The validator is forcefully exited from the active set.
+        Validators that are already inactive are left untouched.
+        """
+        if not self.active[validator.index]:
+            return
+
+        # The validator's whole stake leaves the active total, not just the slashed part
+        self._total_active_stake -= int(self.stake[validator.index])
+        slashed_amount = int(self.stake[validator.index] * NetworkConfig.SLASHING_PENALTY_PERCENTAGE)
+        self.stake[validator.index] -= slashed_amount
+        self.active[validator.index] = False
+
+        # Move the validator from the active partition to the inactive one
+        position = int(np.searchsorted(self.active_indices, validator.index))
+        del self.active_validators[position]
+        num_active = len(self.active_validators)
+        self._active_indices_buffer[position:num_active] = self._active_indices_buffer[position + 1:num_active + 1]
+        self.active_indices = self._active_indices_buffer[:num_active]
+        self.inactive_validators.append(validator)
+        self._alias_dirty = True
+        # Verbose runs report the slashing right away; otherwise it goes into the epoch's table
+        if NetworkConfig.VERBOSE:
+            console.log(f"[bold red]CRITICAL: Validator {validator.name} SLASHED! Lost {slashed_amount / NetworkConfig.GWEI_PER_ETH:.4f} ETH and ejected from the network.[/bold red]")
+        else:
+            self._slashing_events.append((self.current_slot, validator, slashed_amount))
+
+    def _flush_slashing_events(self):
+        """Prints the slashing events collected during the epoch as a single table."""
+        if not self._slashing_events:
+            return
+
+        table = Table(title=f"Slashing Events in Epoch {self.current_epoch}", title_style="bold red")
+        table.add_column("Slot", justify="right")
+        table.add_column("Validator Name", style="cyan", no_wrap=True)
+        table.add_column("Slashed (ETH)", justify="right", style="red")
+        for slot, validator, slashed_amount in self._slashing_events:
+            table.add_row(str(slot), validator.name, f"{slashed_amount / NetworkConfig.GWEI_PER_ETH:.4f}")
+        console.print(table)
+        self._slashing_events.clear()
 
     def _process_epoch_end(self):
         """
@@ -162,39 +327,50 @@ class PoSNetwork:
         2. Distribute rewards to active attesters.
         3. Apply penalties to inactive validators.
         4. Reset validator metrics for the next epoch.
+        Each step is a vectorized operation over the state columns.
         """
         console.log(f"\n[bold magenta]>>>> Epoch {self.current_epoch} finished. Processing rewards and penalties... <<<<[/bold magenta]")
-        active_validators = self._get_active_validators()
-        if not active_validators:
+        self._flush_slashing_events()
+        num_active = len(self.active_validators)
+        if not num_active:
             return
 
-        total_active_stake = sum(v.staked_amount for v in active_validators)
-        
-        # The total reward pool scales with the amount of stake participating
-        epoch_reward_pool = total_active_stake * NetworkConfig.BASE_REWARD_PER_EPOCH
-        base_reward_per_validator = epoch_reward_pool / len(active_validators) 
-        
-        for validator in active_validators:
-            # Reward for attesting
-            if validator.slots_attested > 0:
-                # Reward is proportional to participation
-                participation_rate = validator.slots_attested / (validator.slots_attested + validator.slots_missed)
-                reward = base_reward_per_validator * participation_rate
-                validator.process_epoch_rewards(reward)
-
-            # Penalty for inactivity
-            if validator.slots_missed > 0:
-                penalty = base_reward_per_validator * NetworkConfig.INACTIVITY_PENALTY_FACTOR
-                validator.process_inactivity_penalty(penalty)
-            
-            # Bonus for proposing a block
-            if validator.proposed_blocks > 0:
-                proposer_bonus = base_reward_per_validator * NetworkConfig.PROPOSER_BONUS_FACTOR * validator.proposed_blocks
-                validator.process_epoch_rewards(proposer_bonus, is_proposer_bonus=True)
-
-            validator.reset_epoch_metrics()
-
-        self.display_validator_status()
+        total_active_stake = self._total_active_stake
+
+        # The total reward pool follows the Eth2 base reward formula: it grows with the
+        # amount of stake participating, but only with its square root per unit of stake
+        epoch_reward_pool = total_active_stake * NetworkConfig.BASE_REWARD_FACTOR // math.isqrt(total_active_stake)
+        base_reward_per_validator = epoch_reward_pool // num_active
+
+        # Per-epoch constants, computed once for all validators
+        penalty_unit = int(base_reward_per_validator * NetworkConfig.INACTIVITY_PENALTY_FACTOR)
+        bonus_unit = int(base_reward_per_validator * NetworkConfig.PROPOSER_BONUS_FACTOR)
+
+        # Net balance change in a single pass: a reward proportional to participation,
+        # a penalty for any missed attestation, and a bonus per proposed block.
+        delta = (
+            base_reward_per_validator * self.attested // np.maximum(self.attested + self.missed, 1)
+            - penalty_unit * (self.missed > 0)
+            + bonus_unit * self.proposed
+        )
+        delta *= self.active
+        self.stake += delta
+        self.rewards += delta
+        self._total_active_stake += int(delta.sum())
+
+        self.attested[:] = 0
+        self.missed[:] = 0
+        self.proposed[:] = 0
+
+        # Stakes changed, so the alias tables used for proposer selection are stale
+        self._alias_dirty = True
+
+        # The full status table is O(N log N) to build, so it is only printed every epoch in verbose mode
+        if NetworkConfig.VERBOSE:
+            self.display_validator_status()
+        else:
+            console.log(f"Epoch {self.current_epoch}: {num_active} active validators, "
+                        f"{self._total_active_stake / NetworkConfig.GWEI_PER_ETH:.4f} ETH total active stake.")
 
     def display_validator_status(self):
         """Prints a summary table of all validators' current status."""
@@ -205,11 +381,13 @@ class PoSNetwork:
         table.add_column("Stake (ETH)", justify="right", style="green")
         table.add_column("Total Rewards (ETH)", justify="right", style="yellow")
 
-        for validator in sorted(self.validators.values(), key=lambda v: v.staked_amount, reverse=True):
+        validators = list(self.validators.values())
+        for index in np.argsort(-self.stake, kind="stable").tolist():
+            validator = validators[index]
             status = "[green]Active[/green]" if validator.is_active else "[red]Slashed[/red]"
             table.add_row(
                 validator.name,
-                validator.id,
+                str(validator.id),
                 status,
                 f"{validator.staked_amount:.4f}",
                 f"{validator.rewards_earned:.6f}"
@@ -223,39 +401,63 @@ class PoSNetwork:
         for epoch in range(num_epochs):
             self.current_epoch = epoch
             console.log(f"\n[bold blue]--- Starting Epoch {self.current_epoch} ---[/bold blue]")
-            
-            for _ in range(NetworkConfig.SLOTS_PER_EPOCH):
+
+            # Consistency check: balances are exact integers, so the running total must match a full recount
+            assert self._total_active_stake == int(self.stake[self.active_indices].sum()), "Total active stake out of sync"
+
+            # Draw the whole epoch's slashable-offense schedule upfront
+            slash_slots = self._rng.random(NetworkConfig.SLOTS_PER_EPOCH) < NetworkConfig.SLASHABLE_OFFENSE_PROBABILITY
+
+            # 1. Select the proposers for every slot of the epoch in one batch
+            proposers = self._select_block_proposers(NetworkConfig.SLOTS_PER_EPOCH)
+            batch_start = 0
+
+            for slot_in_epoch in range(NetworkConfig.SLOTS_PER_EPOCH):
                 self.current_slot += 1
                 #console.log(f"-- Slot {self.current_slot} --")
 
-                # 1. Select a proposer for the current slot
-                proposer = self._select_block_proposer()
-                if not proposer:
+                if not proposers:
+                    self._flush_slashing_events()
                     console.log("[bold red]No active validators to propose a block. Halting simulation.[/bold red]")
+                    self.display_validator_status()
                     return
+                proposer = proposers[slot_in_epoch - batch_start]
 
                 # 2. Proposer creates a block
-                new_block = proposer.propose_block(self.current_slot)
+                slot_time = self.genesis_time + self.current_slot * NetworkConfig.SECONDS_PER_SLOT
+                new_block = proposer.propose_block(self.current_slot, len(self.validators), slot_time)
+                self.proposed[proposer.index] += 1
                 
                 # 3. Simulate a rare slashable offense (e.g., double-voting)
-                if random.random() < NetworkConfig.SLASHABLE_OFFENSE_PROBABILITY:
-                    proposer.process_slashing()
+                if slash_slots[slot_in_epoch]:
+                    self.process_slashing(proposer)
+                    # The weight distribution changed, so re-draw the proposers for the remaining slots
+                    batch_start = slot_in_epoch + 1
+                    proposers = self._select_block_proposers(NetworkConfig.SLOTS_PER_EPOCH - batch_start)
                     # If slashed, the proposed block is invalid
                     continue 
 
-                # 4. Other validators attest to the new block
-                attesting_validators = self._get_active_validators()
-                for attester in attesting_validators:
-                    if attester.id != proposer.id:
-                        if attester.attest_to_block():
-                            new_block.add_attestation(attester.id)
+                # 4. Other validators attest to the new block.
+                # A single vectorized draw models network latency or node downtime for everyone.
+                attesters = self.active.copy()
+                attesters[proposer.index] = False
+                online = self._rng.random(len(attesters)) < NetworkConfig.VALIDATOR_ONLINE_PROBABILITY
+                attested = attesters & online
+                self.attested += attested
+                self.missed += attesters & ~online
+                new_block.attestations |= attested
 
                 self.chain.append(new_block)
 
             # 5. End of Epoch Processing
             self._process_epoch_end()
-            time.sleep(1) # Pause for readability
+            # Pause for readability, but never when output is piped or captured (benchmarks, CI)
+            if NetworkConfig.INTERACTIVE and console.is_terminal:
+                time.sleep(1)
 
+        if not NetworkConfig.VERBOSE:
+            # Per-epoch status tables are only printed in verbose mode, so show the final state once
+            self.display_validator_status()
         console.log("\n[bold green]Simulation finished.[/bold green]")
 
 